@@ -1,8 +1,37 @@
+import functools
 import numpy as np
 from pol2cart import pol2cart
 
 
-def create_mappable(radius_steps, degree_steps, interp_vals):
+@functools.lru_cache(maxsize=8)
+def _polar_xy_grid(rho_bytes, theta_bytes, dtype):
+    """
+    A cached helper to convert the polar grid of `create_mappable` to
+    Cartesian (x,y) coordinates, so repeated calls on the same grid (e.g. one
+    per timestep) skip the trig and allocation of the full grid.
+
+    Parameters
+    ----------
+    rho_bytes, theta_bytes : bytes
+        Raw bytes of the 1D rho & theta vectors, which serve as the cache key.
+    dtype : data-type
+        Floating point type of the rho & theta vectors.
+
+    Returns
+    -------
+    x, y : ndarrays
+        Read-only Cartesian coordinates, shared by all calls on the same grid.
+    """
+
+    rho = np.frombuffer(rho_bytes, dtype=dtype)
+    theta = np.frombuffer(theta_bytes, dtype=dtype)
+    (x, y) = pol2cart(theta, rho[:, None]) # broadcast to cartesian (x,y) grid
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y
+
+
+def create_mappable(radius_steps, degree_steps, interp_vals, dtype=np.float32):
     """
     A function to create mappable inputs to contourf plot, for visualizing data
     obtained from radial interpolation.
@@ -17,12 +46,17 @@ def create_mappable(radius_steps, degree_steps, interp_vals):
         circle interpolator.
     interp_vals : ndarray
         Interpolated values corresponding to above (km, deg) coordinates.
+    dtype : data-type, optional
+        Floating point type of the returned arrays, default is float32 as
+        single precision is sufficient for contourf plotting (and halves
+        memory). Set to np.float64 to keep full precision.
 
     Returns
     -------
     x, y : ndarrays
         Cartesian coordinates on unit circle, corresponding to (km, deg)
-        coordinates obtained from radial interpolation.
+        coordinates obtained from radial interpolation. These are cached and
+        shared between calls on the same grid, so are read-only.
     array : ndarray
         Interpolated values corresponding to Cartesian (x,y) coordinates above
         for contourf plotting.
@@ -32,11 +66,12 @@ def create_mappable(radius_steps, degree_steps, interp_vals):
     assert radius_steps[0] == 0, """
 Starting radius must be zero for contourf mappable"""
 
-    rho = radius_steps/radius_steps[-1] # radius values on unit circle (r = 1)
-    theta = np.deg2rad(degree_steps) # convert to radians
-    array = np.reshape(interp_vals,(len(radius_steps),len(degree_steps))) # reshape to match coordinates
-    (th, rh) = np.meshgrid(theta, rho) # create meshgrid on polar coordinates
-    (x, y) = pol2cart(th, rh) # convert meshgrid to cartesian (x,y) coordinates
+    # Cast inputs up front so all downstream math runs in the output dtype
+    inv_max = 1.0/radius_steps[-1] # multiply by reciprocal, cheaper than divide
+    rho = np.multiply(radius_steps, inv_max, dtype=dtype) # radius values on unit circle (r = 1)
+    theta = np.deg2rad(degree_steps).astype(dtype) # convert to radians
+    array = np.reshape(interp_vals.astype(dtype, copy=False),(len(radius_steps),len(degree_steps))) # reshape to match coordinates
+    (x, y) = _polar_xy_grid(rho.tobytes(), theta.tobytes(), dtype)
 
     # Return 3 vectors - the array values, the x-coordinates, and the
     # y-coordinates for input into contourf plot.
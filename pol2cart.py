@@ -8,10 +8,11 @@ def pol2cart(theta, rho):
 
     Parameters
     ----------
-    theta : int or float
+    theta : int, float or ndarray
         Theta coordinates (in radians) on polar coordinate grid.
-    rho : int or float
-        Rho coordinates (between 0 and 1) on polar coordinate grid.
+    rho : int, float or ndarray
+        Rho coordinates (between 0 and 1) on polar coordinate grid; must be
+        broadcastable against `theta`.
 
     Returns
     -------
@@ -20,6 +21,9 @@ def pol2cart(theta, rho):
         coordinates.
     """
 
+    # sin & cos are taken of theta as given and only the scaling by rho is
+    # broadcast, so a row of azimuths against a column of radii needs just
+    # one sin & cos per azimuth
     x = rho * np.cos(theta)
     y = rho * np.sin(theta)
     return(x,y)
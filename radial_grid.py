@@ -57,17 +57,25 @@ Radius steps must be less than full radius"""
     assert 0 < degree_resolution <= 90,"""
 Degree resolution should be positive value not exceeding 90"""
 
+    # Number of whole steps that fit within each range (the small tolerance
+    # guards against float round-off when the range is an exact multiple)
+    n_rings = int(np.floor((end_radius - start_radius)/radius_step + 1e-9)) + 1
+    n_degrees = int(np.floor(360/degree_resolution + 1e-9)) + 1
+
+    # np.linspace places each value directly, rather than accumulating the
+    # step as np.arange does, so no ring or azimuth overshoots the range
+    radius_steps = np.linspace(start_radius,
+                               start_radius + (n_rings - 1)*radius_step,
+                               n_rings)
+    degree_steps = np.linspace(0, (n_degrees - 1)*degree_resolution,
+                               n_degrees)
+
     # If start_radius is set to zero, will duplicate interpolation of origin
     # and 0-degree (360-degree) azimuth. This is done to create smooth contourf
-    # plot for visualization.
-    if start_radius == 0:
-        radius_steps = np.arange(start_radius,end_radius+1,radius_step)
-        degree_steps = np.arange(0,361,degree_resolution)
-
-    # Version without duplication, for computing statistics.
-    else:
-        radius_steps = np.arange(start_radius,end_radius+1,radius_step)
-        degree_steps = np.arange(0+degree_resolution,361,degree_resolution)
+    # plot for visualization. Otherwise drop the 0-degree azimuth, giving a
+    # version without duplication for computing statistics.
+    if start_radius != 0:
+        degree_steps = degree_steps[1:]
 
     return radius_steps, degree_steps
 
@@ -1,7 +1,42 @@
+import warnings
 import numpy as np
-import geopy
-import geopy.distance as gd
-import scipy.interpolate as si
+import scipy.ndimage as sn
+import scipy.special as sc
+
+# Mean radius of the Earth (km) used for computing destination points
+EARTH_RADIUS = 6371.0088
+
+
+def _fractional_index(coords, grid):
+    """
+    A helper function to locate coordinates on a regular grid vector, as
+    fractional (floating point) indices for use with
+    `scipy.ndimage.map_coordinates`.
+
+    Parameters
+    ----------
+    coords : ndarray
+        Coordinates (e.g. latitudes) to locate on the grid.
+    grid : ndarray
+        Monotonic (ascending or descending) vector of grid coordinates.
+
+    Returns
+    -------
+    index : ndarray
+        Fractional indices of `coords` along `grid`.
+    """
+
+    grid = np.asarray(grid)
+    index = np.arange(grid.size)
+    if grid[0] > grid[-1]:
+        # np.interp needs ascending sample points
+        grid = grid[::-1]
+        index = index[::-1]
+
+    if np.any(coords < grid[0]) or np.any(coords > grid[-1]):
+        raise ValueError("Interpolation points fall outside of data grid")
+
+    return np.interp(coords, grid, index)
 
 
 def radial_interp(a, a_lats, a_lons, center_lat, center_lon, radius_steps,
@@ -58,6 +93,16 @@ def radial_interp(a, a_lats, a_lons, center_lat, center_lon, radius_steps,
         The latitude coordinates of interpolated points.
     interp_lon : ndarray
         The longitude coordinates of interpolated points.
+
+    Notes
+    -----
+    Interpolation points are found by travelling each ring's distance along
+    each bearing from the origin on a sphere of radius `EARTH_RADIUS`
+    (6371.0088 km), not on the WGS84 ellipsoid. This places points up to
+    ~14 km (about 0.5% of the ring distance) away from their ellipsoidal
+    (geodesic) positions at 2500 km from the origin; expressed in degrees,
+    the longitude difference grows toward the poles (close to 1 degree for
+    origins near 75N).
     """
 
     assert 2 <= a.ndim <= 3, "Input array must be 2D or 3D"
@@ -68,23 +113,79 @@ def radial_interp(a, a_lats, a_lons, center_lat, center_lon, radius_steps,
     if np.size(center_lon) != 1:
         raise ValueError("Must provide single value for longitude")
 
-    interp_lat = []
-    interp_lon = []
-
-    for km in radius_steps:
-        for deg in degree_steps:
-            start = geopy.Point(center_lat,center_lon)
-            transect = gd.distance(kilometers = km)
-            dest = transect.destination(point = start, bearing = deg)
-            interp_lat.append(dest[0])
-            interp_lon.append(dest[1])
-
-    if radius_steps[0] != 0:
+    a_lats = np.ascontiguousarray(a_lats, dtype=np.float64)
+    a_lons = np.ascontiguousarray(a_lons, dtype=np.float64)
+
+    # Angular distance of each ring (as a column) and bearing of each
+    # azimuth; broadcasting the two forms the radial grid, ordered ring by
+    # ring to match the layout expected by `create_mappable`
+    delta = np.asarray(radius_steps)[:, None]/EARTH_RADIUS
+    lon1 = np.deg2rad(center_lon)
+
+    # Trig tables are computed along each axis of the grid only, leaving
+    # arcsin & arctan2 as the only functions evaluated at every point. Angles
+    # given in degrees go straight to sindg & cosdg, which skip the separate
+    # conversion to radians and reduce the argument exactly (e.g. the cosine
+    # of a 90 degree bearing is exactly zero)
+    sin_lat1 = sc.sindg(center_lat)
+    cos_lat1 = sc.cosdg(center_lat)
+    cos_delta = np.cos(delta)
+    cos_lat1_sin_delta = cos_lat1*np.sin(delta)
+    sin_bearing = sc.sindg(degree_steps)
+    cos_bearing = sc.cosdg(degree_steps)
+
+    # When the rings start away from the origin, the origin itself is
+    # interpolated too and is stored ahead of the ring points
+    offset = int(radius_steps[0] != 0)
+    n_points = delta.size*sin_bearing.size
+    interp_lat = np.empty(offset + n_points)
+    interp_lon = np.empty(offset + n_points)
+    if offset:
         # Add lat & lon of origin
-        interp_lat = np.hstack([center_lat, interp_lat])
-        interp_lon = np.hstack([center_lon, interp_lon])
-
-    interp_vals = si.interpn((a_lons,a_lats),a,(interp_lon,interp_lat))
+        interp_lat[0] = center_lat
+        interp_lon[0] = center_lon
+
+    # Destination point given distance and bearing from origin, on a sphere
+    sin_lat2 = sin_lat1*cos_delta + cos_lat1_sin_delta*cos_bearing
+    lat2 = np.arcsin(sin_lat2)
+    lon2 = lon1 + np.arctan2(cos_lat1_sin_delta*sin_bearing,
+                             cos_delta - sin_lat1*sin_lat2)
+    np.rad2deg(lat2.ravel(), out=interp_lat[offset:])
+    dest_lon = np.rad2deg(lon2.ravel(), out=interp_lon[offset:])
+    dest_lon += 180 # wrap to [-180, 180)
+    np.mod(dest_lon, 360, out=dest_lon)
+    dest_lon -= 180
+
+    # Fractional grid indices of each point, for bilinear interpolation
+    ix = _fractional_index(interp_lon, a_lons)
+    iy = _fractional_index(interp_lat, a_lats)
+
+    if a.ndim == 2:
+        interp_vals = sn.map_coordinates(a, [ix, iy], output=np.float64,
+                                         order=1, mode='nearest')
+    else:
+        # Viewing `a` as flat (space, time) rows needs C-contiguous memory;
+        # views such as transposes have to be copied first
+        if not a.flags.c_contiguous:
+            warnings.warn("Input array is not C-contiguous and will be "
+                          "copied; pass np.ascontiguousarray(a) to avoid a "
+                          "copy per call", stacklevel=2)
+            a = np.ascontiguousarray(a)
+
+        # Every timestep shares the same points, so gather the four grid
+        # cells surrounding each point for all timesteps at once from a
+        # (space, time) view of the array, then weight them bilinearly
+        (nx, ny, nt) = a.shape
+        i = np.minimum(ix.astype(np.intp), nx - 2)
+        j = np.minimum(iy.astype(np.intp), ny - 2)
+        wx = (ix - i)[:, None]
+        wy = (iy - j)[:, None]
+        a_flat = a.reshape(nx*ny, nt)
+        k = i*ny + j # flat index of lower-left cell
+        interp_vals = a_flat[k] * ((1 - wx)*(1 - wy))
+        interp_vals += a_flat[k + 1] * ((1 - wx)*wy)
+        interp_vals += a_flat[k + ny] * (wx*(1 - wy))
+        interp_vals += a_flat[k + ny + 1] * (wx*wy)
 
     # For mapping on geographic projection, can use the interpolated (lat,
     # lon) values
@@ -0,0 +1,75 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from radial_interp import radial_interp
+
+
+def radial_interp_batch(a, a_lats, a_lons, centers, radius_steps,
+                        degree_steps, max_workers=1):
+    """
+    A function to run radial interpolation around many geographic (lat, lon)
+    points of interest at once, on the same input data and radial grid. Each
+    origin is interpolated independently, so origins can optionally be spread
+    across a pool of worker threads, which share the input array rather than
+    copying it to each worker.
+
+    Parameters
+    ----------
+    a : ndarray
+        2D or 3D input array of values from which to interpolate (data should
+        be spatial and continuous on a regular grid, e.g. raster, reanalysis,
+        climate model output, etc); with 3rd dimension representing time.
+    a_lats : int or float
+        Vector of latitude values defining input data array.
+    a_lons : int or float
+        Vector of longitude values defining input data array.
+    centers : sequence of (lat, lon) pairs
+        Latitude & longitude coordinates of each origin, around which a unit
+        circle interpolator will be built. At least one origin is required.
+    radius_steps : int or float
+        Distance (km) between interpolation rings.
+    degree_steps : int or float
+        Azimuth resolution (degrees) between interpolation
+        points on each interpolation ring.
+    max_workers : int or None, optional
+        Number of worker threads, default is 1 to interpolate origins one
+        after another in the calling thread. Set higher, or to None to let
+        `concurrent.futures.ThreadPoolExecutor` choose based on the number of
+        CPUs, to interpolate origins concurrently; this only pays off with
+        several CPUs available, and adds overhead on a single CPU.
+
+    Returns
+    -------
+    interp_vals : ndarray
+        Interpolated values for each origin, stacked along the first axis:
+        (origins, interpolated values) for 2D input array, or (origins,
+        interpolated values, timesteps) for 3D input array.
+    """
+
+    if len(centers) == 0:
+        raise ValueError("Must provide at least one origin")
+
+    # 3D inputs need contiguous memory in radial_interp, so make any copy
+    # once here rather than once per origin (2D inputs need no copy)
+    if a.ndim == 3:
+        a = np.ascontiguousarray(a)
+
+    def interp_center(center):
+        (center_lat, center_lon) = center
+        return radial_interp(a, a_lats, a_lons, center_lat, center_lon,
+                             radius_steps, degree_steps)
+
+    def fill(results):
+        # Write each origin's values into one output array as they arrive,
+        # rather than holding them all in a list and stacking at the end
+        for (i, vals) in enumerate(results):
+            if i == 0:
+                interp_vals = np.empty((len(centers),) + vals.shape,
+                                       dtype=vals.dtype)
+            interp_vals[i] = vals
+        return interp_vals
+
+    if max_workers == 1:
+        return fill(map(interp_center, centers))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return fill(executor.map(interp_center, centers))